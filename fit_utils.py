@@ -4,8 +4,6 @@ import pandas as pd
 import numpy as np
 from astropy.time import Time
 
-from nmma.em.model import SVDLightCurveModel, GRBLightCurveModel, KilonovaGRBLightCurveModel, SupernovaGRBLightCurveModel, SupernovaLightCurveModel, ShockCoolingLightCurveModel
-
 # Useful functions used by nmma_fit.py
 
 def get_bestfit_lightcurve(model,
@@ -28,6 +26,10 @@ def get_bestfit_lightcurve(model,
     #instead of posterior_file, should it be given the candidate
     #name?
 
+    # Imported here so make_jobs.py, which only needs parse_csv,
+    # doesn't pay for loading the NMMA models on every run
+    from nmma.em.model import SVDLightCurveModel, GRBLightCurveModel, KilonovaGRBLightCurveModel, SupernovaGRBLightCurveModel, SupernovaLightCurveModel, ShockCoolingLightCurveModel
+
     #################
     # Setup the model
     #################
@@ -72,9 +74,7 @@ def get_bestfit_lightcurve(model,
     ##########################
     posterior_samples = pd.read_csv(posterior_file, header=0, delimiter=' ')
     bestfit_idx = np.argmax(posterior_samples.log_likelihood.to_numpy())
-    bestfit_params = posterior_samples.to_dict(orient='list')
-    for key in bestfit_params.keys():
-        bestfit_params[key] = bestfit_params[key][bestfit_idx]
+    bestfit_params = {key: posterior_samples[key].iloc[bestfit_idx] for key in posterior_samples.columns}
 
     #########################
     # Generate the lightcurve
@@ -98,10 +98,12 @@ def parse_csv(infile,
     # photometry data
     out_data = []
 
-    for line in np.atleast_1d(in_data):
-        #extract time and put in isot format
-        time = Time(line[1], format='jd').isot
+    in_data = np.atleast_1d(in_data)
+    #extract times and put in isot format
+    #converted in one call since building a Time per row dominates for long lightcurves
+    times = Time([line[1] for line in in_data], format='jd').isot
 
+    for line, time in zip(in_data, times):
         filter = line[4]
 
         magnitude = line[2]
@@ -119,8 +121,7 @@ def parse_csv(infile,
     # output the data
     # in the format desired by NMMA
     out_file = open(outdir + candname + ".dat", 'w')
-    for line in out_data:
-        out_file.write(line[0] + " " + line[1] + " " + line[2] + " " + line[3] + "\n")
+    out_file.write("".join(" ".join(line) + "\n" for line in out_data))
     out_file.close()
 
     return out_data
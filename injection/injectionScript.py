@@ -4,6 +4,7 @@ import os
 import argparse
 import json
 import time
+import shutil
 
 import numpy as np
 import pandas as pd
@@ -117,12 +118,11 @@ print('%s lightcurve generation complete' % Time(time.time(),format='unix').isot
 for ext in ('.out','.err'):
     logPath = os.path.join('./logs',''.join((job_id,ext)))
     destLogPath = os.path.join(args.outfolder,''.join(('job',ext)))
-    cpString = ' '.join((
-    'cp',
-    logPath,
-    destLogPath
-    ))
-    cpCommand = subprocess.run(cpString, shell=True,capture_output=True)
+    ## copied directly rather than spawning a shell for cp
+    try:
+        shutil.copyfile(logPath, destLogPath)
+    except OSError:
+        pass
 
 if args.tar: ##not working, first line is being taken as noneType
     tar_name = ''.join((args.outfolder.split('/').remove('')[-1],'.tar.gz'))
@@ -4,6 +4,7 @@ import sys
 import glob
 import time
 import argparse
+import shutil
 
 import numpy as np
 
@@ -96,6 +97,16 @@ print("cwd: %s" % os.getcwd())
 log_filename = "fit.log"
 log_filename = os.path.join("./",log_filename)
 
+def write_log(message, attach=None):
+    ## appends message to the log file, followed by the contents of the file attach if given
+    logfile = open(log_filename, "a")
+    logfile.write(message)
+    if attach:
+        attachfile = open(attach, 'r')
+        shutil.copyfileobj(attachfile, logfile)
+        attachfile.close()
+    logfile.close()
+
 
 #could allow code to send batches to different machines
 
@@ -115,17 +126,13 @@ for file in glob.glob(search_directory + "/*.csv"):
     file_list.append(file)
     candidate_files.append(candfile)
     candidate_names.append(candname)
-    
-    ## Explicitly list candidates in logfile
-    logfile = open(log_filename, "a+")
-    logfile.write("Found object: %s" % candname +"\n")
-    logfile.close()
-    print("Found object: %s" % candname) 
+    print("Found object: %s" % candname)
 
-if not candidate_names: ## If there are no candidates found, quit here
-    logfile = open(log_filename, "a+")
-    logfile.write("No objects found \n")
-    logfile.close()
+## Explicitly list candidates in logfile, in one write rather than reopening it per candidate
+if candidate_names:
+    write_log("".join("Found object: %s\n" % candname for candname in candidate_names))
+else: ## If there are no candidates found, quit here
+    write_log("No objects found \n")
     #quit()
 ## want to alter structure so recurring job checks that all candidates have existing subdirectories
 ## rather than checking if a daily directory has been made; it would also be useful to have the option
@@ -145,19 +152,16 @@ for ii in range(len(file_list)):
         if not np.isinf(float(line[3])):
             detections += 1
     if detections < 2:
-        logfile = open(log_filename, "a+")
-        logfile.write("Not enough data for candidate %s... continuing\n"%candidate_names[ii])
-        logfile.close()
+        write_log("Not enough data for candidate %s... continuing\n"%candidate_names[ii])
         print("Not enough data for candidate %s... continuing\n"%candidate_names[ii])
         continue
     #Submit jobs for each model
     for model in model_list:
         print("should be submitting %s job"%model)
-        # -TODO- May want to eliminate shell=True. Apparently there are security holes associated with that.
         # Submit job
         ## Trying to add argument so it corrects directory change in nmma_fit
         ## Would like to also have it dynamically update job name to also include fit name
-        command = subprocess.run("sbatch -J " + candidate_names[ii] +"_" + model + " " + job_name[model] + " " + file_list[ii] + " " + candidate_names[ii] + " " + model + " " + latest_directory, shell=True, capture_output=True)
+        command = subprocess.run(["sbatch", "-J", candidate_names[ii] + "_" + model, job_name[model], file_list[ii], candidate_names[ii], model, latest_directory], capture_output=True)
         output = command.stdout
         outerr = command.stderr
         
@@ -165,15 +169,11 @@ for ii in range(len(file_list)):
         output = str(output, 'utf-8')
         outerr = str(outerr, 'utf-8')
 
-        logfile = open(log_filename, "a")
-        logfile.write(outerr)
-        logfile.close()
+        write_log(outerr)
                 
         # Job id is generally the last part of the job submission output
         job_id = int(output.split(' ')[-1])
-        logfile = open(log_filename, "a")
-        logfile.write("Submitted job for candidate " + candidate_names[ii] + ", model " + model + ". Job id: " + str(job_id) + "\n")
-        logfile.close()
+        write_log("Submitted job for candidate " + candidate_names[ii] + ", model " + model + ". Job id: " + str(job_id) + "\n")
         print("Submitted job for candidate " + candidate_names[ii] + ", model " + model + ". Job id: " + str(job_id) + "\n")
         
         job_id_list.append(job_id)
@@ -187,39 +187,27 @@ while len(live_jobs) > 0:
     currentTime = time.time()
     if currentTime-startTime > args.timeout:
         print("timeout error")
-        logfile = open(log_filename, "a")
-        logfile.write("Timeout Error: Jobs exceeded time allotment \n")
-        logfile.close()
+        write_log("Timeout Error: Jobs exceeded time allotment \n")
         break
 
     finished_jobs = []
     ## not a huge concern for a finite number of jobs, but doesn't the current behavior rebuild finished_jobs with every loop?
+    ## list the fit directory once per check rather than stat-ing every job's files on panfs
+    present_files = set(os.listdir('.'))
     for id, (candname, model) in live_jobs.items():
         # nmma_fit makes a .fin file when done
-        if os.path.isfile(candname + "_" + model + ".fin"):
+        if candname + "_" + model + ".fin" in present_files:
             # Do something now that we know the job is done
             ## Need to alter behavior so it can handle a job failing before the .fin is made
             ## temporarily, this is addressed by there being a timeout for how long to wait before pushing to schoty
-            logfile = open(log_filename, "a")
-            logfile.write("Job " + str(id) + " for candidate " + candname + " with model " + model + " completed. Produced the following output: \n")
+            write_log("Job " + str(id) + " for candidate " + candname + " with model " + model + " completed. Produced the following output: \n", attach=str(id) + ".out")
             print("Job " + str(id) + " for candidate " + candname + " with model " + model + " completed.")
             
-            outfile = open(str(id) + ".out", 'r')
-            logfile.write(outfile.read())
-            outfile.close()
-                
-            logfile.close()
-            
             finished_jobs.append(id)
             # Check if there were errors?
             # -TODO- Push the data back.
-        elif os.path.isfile(str(id) + ".err") and os.path.getsize(str(id) + ".err") != 0:
-            logfile = open(log_filename, "a")
-            logfile.write("Job " + str(id) + " for candidate " + candname + " encountered the following errors: \n")
-            errorfile = open(str(id) + ".err", 'r')
-            logfile.write(errorfile.read())
-            errorfile.close()
-            logfile.close()
+        elif str(id) + ".err" in present_files and os.path.getsize(str(id) + ".err") != 0:
+            write_log("Job " + str(id) + " for candidate " + candname + " encountered the following errors: \n", attach=str(id) + ".err")
             finished_jobs.append(id)
 
     # update the live job list
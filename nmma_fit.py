@@ -11,14 +11,9 @@ from matplotlib.pyplot import cm
 from astropy.time import Time
  
 from fit_utils import get_bestfit_lightcurve, parse_csv
-from astropy.time import Time
 
-from nmma.em.model import SVDLightCurveModel, GRBLightCurveModel, KilonovaGRBLightCurveModel, SupernovaGRBLightCurveModel
 from nmma.em.utils import loadEvent, getFilteredMag
 
-import seaborn as sns
-
-
 
 
 # Command line args
@@ -86,24 +81,18 @@ error_budget = 1.0
 label = model 
 data_file = "./candidate_data/" + candname + ".dat"
 
+# Detection times (non-detections have infinite error), converted in one call.
+# Need to search the whole file since they are not always ordered.
+detection_times = [line[0] for line in nmma_data if not np.isinf(float(line[3]))]
+first_detection = float(np.min(Time(detection_times, format='isot').mjd)) if detection_times else np.inf
+
 # Set the trigger time
 if fit_trigger_time:
     # Set to earliest detection in preparation for fit
-    # Need to search the whole file since they are not always ordered.
-    trigger_time = np.inf
-    for line in nmma_data:
-        if np.isinf(float(line[3])):
-            continue
-        elif Time(line[0], format='isot').mjd < trigger_time:
-            trigger_time = Time(line[0], format='isot').mjd
+    trigger_time = first_detection
 elif trigger_time_heuristic:
     # One day before the first non-zero point
-    trigger_time = np.inf
-    for line in nmma_data:
-        if np.isinf(float(line[3])):
-            continue
-        elif (Time(line[0], format='isot').mjd - 1) < trigger_time:
-            trigger_time = Time(line[0], format='isot').mjd - 1
+    trigger_time = first_detection - 1
 else:
     # Set the trigger time
     trigger_time = t0
@@ -137,46 +126,28 @@ if not os.path.isdir(plotdir):
 
 # Set the prior file. Depends on model and if trigger time is a parameter.
 # -TODO- will want to standardize names to be computable from model name and/or use an argument for the file name.
+prior_name = {"nugent-hyper": "ZTF_sn", # SN
+              "TrPi2018": "ZTF_grb", # GRB
+              "Piro2021": "ZTF_sc", # Shock cooling
+              "Bu2019lm": "ZTF_kn",} # KN
 if prior == None:
-    if model == 'nugent-hyper':
-        # SN
-        if fit_trigger_time:
-            prior = '/panfs/roc/groups/7/cough052/barna314/nmma_fitter/ZTF_sn_t0.prior'
-        else:
-            prior = '/panfs/roc/groups/7/cough052/barna314/nmma_fitter/ZTF_sn.prior'
-    elif model == 'TrPi2018':
-        # GRB
-        if fit_trigger_time:
-            prior = '/panfs/roc/groups/7/cough052/barna314/nmma_fitter/ZTF_grb_t0.prior'
-        else:
-            prior = '/panfs/roc/groups/7/cough052/barna314/nmma_fitter/ZTF_grb.prior'
-    elif model == 'Piro2021':
-        # Shock cooling
-        if fit_trigger_time:
-            prior = '/panfs/roc/groups/7/cough052/barna314/nmma_fitter/ZTF_sc_t0.prior'
-        else:
-            prior = '/panfs/roc/groups/7/cough052/barna314/nmma_fitter/ZTF_sc.prior'
-    elif model == 'Bu2019lm':
-        # KN
-        if fit_trigger_time:
-            prior = '/panfs/roc/groups/7/cough052/barna314/nmma_fitter/ZTF_kn_t0.prior'
-        else:
-            prior = '/panfs/roc/groups/7/cough052/barna314/nmma_fitter/ZTF_kn.prior'
-    else:
+    if model not in prior_name:
         print("nmma_fit.py does not know of the prior file for model ", model)
         exit(1)
+    prior = '/panfs/roc/groups/7/cough052/barna314/nmma_fitter/' + prior_name[model]\
+        + ('_t0' if fit_trigger_time else '') + '.prior'
 
 # NMMA lightcurve fitting
-# triggered with a shell command
-command_string = "mpiexec -np " + str(cpus) + " light_curve_analysis"\
-    + " --model " + model + " --svd-path " + svd_path + " --outdir " + plotdir\
-    + " --label " + model + " --trigger-time " + str(trigger_time)\
-    + " --data " + data_file + " --prior " + prior + " --tmin " + str(tmin)\
-    + " --tmax " + str(tmax) + " --dt " + str(dt) + " --error-budget " + str(error_budget)\
-    + " --nlive " + str(nlive) + " --Ebv-max " + str(Ebv_max)+\
-    " --detection-limit \"{\'r\':21.5, \'g\':21.5, \'i\':21.5}\""
-
-command = subprocess.run(command_string, shell=True, capture_output=True)
+# run directly from an argument list rather than through a shell
+command_args = ["mpiexec", "-np", str(cpus), "light_curve_analysis",
+    "--model", model, "--svd-path", svd_path, "--outdir", plotdir,
+    "--label", model, "--trigger-time", str(trigger_time),
+    "--data", data_file, "--prior", prior, "--tmin", str(tmin),
+    "--tmax", str(tmax), "--dt", str(dt), "--error-budget", str(error_budget),
+    "--nlive", str(nlive), "--Ebv-max", str(Ebv_max),
+    "--detection-limit", "{'r':21.5, 'g':21.5, 'i':21.5}"]
+
+command = subprocess.run(command_args, capture_output=True)
 sys.stdout.buffer.write(command.stdout)
 sys.stderr.buffer.write(command.stderr)
 